@@ -6,56 +6,150 @@ Then visit: http://localhost:5000
 
 import threading
 import json
+import queue
 import time
 import uuid
-from flask import Flask, render_template, request, jsonify, send_file
+import orjson
+from dataclasses import dataclass, field
+from typing import Optional
+from flask import Flask, Response, render_template, request, jsonify, send_file
 from scanner import run_scan, export_json, export_csv
 import os
 
 app = Flask(__name__)
 app.secret_key = "netport-scanner-secret"
 
-# In-memory job store: { job_id: { status, progress, results } }
+
+@dataclass
+class Job:
+    """
+    State for one background scan. Counters are plain attribute writes
+    (atomic under the GIL); `lock` only guards `open_ports_live`.
+    """
+    job_id: str
+    host: str
+    total: int
+    status: str = "queued"
+    progress: float = 0
+    scanned: int = 0
+    open_ports_live: list = field(default_factory=list)
+    results: Optional[dict] = None
+    error: Optional[str] = None
+    report_json: Optional[str] = None
+    cached_status: Optional[bytes] = None  # serialized once the job has finished
+    last_access: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+# In-memory job store: { job_id: Job }. `jobs_lock` guards insertion and eviction.
 jobs = {}
 jobs_lock = threading.Lock()
 
+# Finished jobs not polled for JOB_TTL seconds are evicted every SWEEP_INTERVAL
+JOB_TTL = 3600
+SWEEP_INTERVAL = 60
+DELETE_EXPIRED_REPORTS = False
+
 REPORTS_DIR = "reports"
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
 
-def _run_scan_job(job_id, host, port_range, threads, timeout):
-    """Background thread that performs the scan and updates job state."""
-    with jobs_lock:
-        jobs[job_id]["status"] = "running"
-        jobs[job_id]["open_ports_live"] = []
+def _status_dict(job):
+    """Snapshot of a job as returned by /api/status."""
+    with job.lock:
+        open_ports_live = list(job.open_ports_live)
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "progress": job.progress,
+        "scanned": job.scanned,
+        "total": job.total,
+        "open_ports_live": open_ports_live,
+        "results": job.results,
+        "error": job.error,
+    }
+
+
+class ScanCancelled(Exception):
+    """Raised from the progress callback to abort a scan nobody is reading."""
+
+
+def _run_scan_job(job_id, host, port_range, threads, timeout, on_event=None, cancelled=None):
+    """
+    Background thread that performs the scan and updates job state.
+    `on_event` (if given) receives progress / open-port events as dicts;
+    setting the `cancelled` threading.Event aborts the scan.
+    """
+    job = jobs[job_id]
+    job.status = "running"
 
     def on_progress(scanned, total, result):
+        if cancelled is not None and cancelled.is_set():
+            raise ScanCancelled("Scan cancelled: client disconnected")
+        job.progress = round(scanned / total * 100, 1)
+        job.scanned = scanned
+        job.total = total
+        if result["state"] == "open":
+            with job.lock:
+                job.open_ports_live.append(result)
+            if on_event:
+                on_event({"type": "open", "port": result})
+        if on_event:
+            on_event({"type": "progress", "progress": job.progress,
+                      "scanned": scanned, "total": total})
+
+    try:
+        results = run_scan(
+            host=host,
+            port_range=port_range,
+            max_threads=threads,
+            timeout=timeout,
+            progress_callback=on_progress,
+        )
+    except Exception as e:
+        # Still reach a terminal state so the client stops polling and the sweeper can evict
+        results = {"error": str(e)}
+
+    # Idle time for eviction counts from completion, not from job creation
+    job.last_access = time.monotonic()
+    if "error" in results:
+        job.error = results["error"]
+        job.status = "error"
+    else:
+        # Save JSON report automatically
+        path = os.path.join(REPORTS_DIR, f"scan_{job_id}.json")
+        export_json(results, path)
+        job.report_json = path
+        job.results = results
+        job.status = "complete"
+    job.cached_status = orjson.dumps(_status_dict(job))
+    if on_event:
+        on_event({"type": "done", "status": job.status,
+                  "results": job.results, "error": job.error})
+
+
+def _sweep_jobs():
+    """Daemon loop that evicts idle finished jobs so `jobs` stays bounded."""
+    while True:
+        time.sleep(SWEEP_INTERVAL)
+        now = time.monotonic()
         with jobs_lock:
-            jobs[job_id]["progress"] = round(scanned / total * 100, 1)
-            jobs[job_id]["scanned"] = scanned
-            jobs[job_id]["total"] = total
-            if result["state"] == "open":
-                jobs[job_id]["open_ports_live"].append(result)
-
-    results = run_scan(
-        host=host,
-        port_range=port_range,
-        max_threads=threads,
-        timeout=timeout,
-        progress_callback=on_progress,
-    )
+            expired = [
+                job_id for job_id, job in jobs.items()
+                if job.status in ("complete", "error") and now - job.last_access > JOB_TTL
+            ]
+            evicted = [jobs.pop(job_id) for job_id in expired]
+        if DELETE_EXPIRED_REPORTS:
+            for job in evicted:
+                # Auto-saved report plus anything written by /api/export
+                for fmt in ("json", "csv"):
+                    try:
+                        os.remove(os.path.join(REPORTS_DIR, f"scan_{job.job_id}.{fmt}"))
+                    except OSError:
+                        pass
 
-    with jobs_lock:
-        if "error" in results:
-            jobs[job_id]["status"] = "error"
-            jobs[job_id]["error"] = results["error"]
-        else:
-            jobs[job_id]["status"] = "complete"
-            jobs[job_id]["results"] = results
-            # Save JSON report automatically
-            path = os.path.join(REPORTS_DIR, f"scan_{job_id}.json")
-            export_json(results, path)
-            jobs[job_id]["report_json"] = path
+
+threading.Thread(target=_sweep_jobs, daemon=True).start()
 
 
 @app.route("/")
@@ -63,35 +157,43 @@ def index():
     return render_template("index.html")
 
 
-@app.route("/api/scan", methods=["POST"])
-def start_scan():
-    data = request.json or {}
+def _parse_scan_request(data):
+    """Validate scan parameters. Returns (params, None) or (None, error_response)."""
     host = data.get("host", "").strip()
     if not host:
-        return jsonify({"error": "Host is required"}), 400
+        return None, (jsonify({"error": "Host is required"}), 400)
 
     try:
         range_str = data.get("range", "1-1024")
         parts = range_str.split("-")
         port_range = (int(parts[0]), int(parts[1]))
     except Exception:
-        return jsonify({"error": "Invalid port range. Use format: start-end"}), 400
+        return None, (jsonify({"error": "Invalid port range. Use format: start-end"}), 400)
 
     threads = min(int(data.get("threads", 200)), 500)
     timeout = float(data.get("timeout", 1.0))
+    return (host, port_range, threads, timeout), None
 
+
+def _create_job(host, port_range):
     job_id = str(uuid.uuid4())[:8]
     with jobs_lock:
-        jobs[job_id] = {
-            "job_id": job_id,
-            "host": host,
-            "status": "queued",
-            "progress": 0,
-            "scanned": 0,
-            "total": port_range[1] - port_range[0] + 1,
-            "open_ports_live": [],
-            "results": None,
-        }
+        jobs[job_id] = Job(
+            job_id=job_id,
+            host=host,
+            total=port_range[1] - port_range[0] + 1,
+        )
+    return job_id
+
+
+@app.route("/api/scan", methods=["POST"])
+def start_scan():
+    params, error = _parse_scan_request(request.json or {})
+    if error:
+        return error
+    host, port_range, threads, timeout = params
+
+    job_id = _create_job(host, port_range)
 
     t = threading.Thread(
         target=_run_scan_job,
@@ -103,34 +205,70 @@ def start_scan():
     return jsonify({"job_id": job_id})
 
 
+@app.route("/api/scan/stream", methods=["POST"])
+def stream_scan():
+    """
+    Run a scan and stream it as NDJSON events, one object per line:
+    {"type": "job"} first (its job_id works with /api/status and
+    /api/export), then "open" per open port and "progress" as ports are
+    scanned, and finally "done" with the status and full results. The
+    scan is cancelled if the client disconnects.
+    """
+    params, error = _parse_scan_request(request.json or {})
+    if error:
+        return error
+    host, port_range, threads, timeout = params
+    job_id = _create_job(host, port_range)
+
+    events = queue.Queue()
+    cancelled = threading.Event()
+    done = object()
+
+    def worker():
+        try:
+            _run_scan_job(job_id, host, port_range, threads, timeout,
+                          on_event=events.put, cancelled=cancelled)
+        finally:
+            events.put(done)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+    def generate():
+        try:
+            yield orjson.dumps({"type": "job", "job_id": job_id}) + b"\n"
+            while True:
+                item = events.get()
+                if item is done:
+                    return
+                yield orjson.dumps(item) + b"\n"
+        finally:
+            # Runs on GeneratorExit when the client goes away mid-scan
+            cancelled.set()
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
 @app.route("/api/status/<job_id>")
 def job_status(job_id):
-    with jobs_lock:
-        job = jobs.get(job_id)
+    # Lock-free read: progress may be slightly stale, which is fine for polling
+    job = jobs.get(job_id)
     if not job:
         return jsonify({"error": "Job not found"}), 404
-    # Return a safe copy
-    return jsonify({
-        "job_id": job_id,
-        "status": job["status"],
-        "progress": job.get("progress", 0),
-        "scanned": job.get("scanned", 0),
-        "total": job.get("total", 0),
-        "open_ports_live": job.get("open_ports_live", []),
-        "results": job.get("results"),
-        "error": job.get("error"),
-    })
+    job.last_access = time.monotonic()
+    if job.cached_status is not None:
+        return Response(job.cached_status, mimetype="application/json")
+    return jsonify(_status_dict(job))
 
 
 @app.route("/api/export/<job_id>/<fmt>")
 def export_report(job_id, fmt):
-    with jobs_lock:
-        job = jobs.get(job_id)
+    job = jobs.get(job_id)
 
-    if not job or job["status"] != "complete":
+    if not job or job.status != "complete":
         return jsonify({"error": "Scan not complete"}), 400
+    job.last_access = time.monotonic()
 
-    results = job["results"]
+    results = job.results
     path = os.path.join(REPORTS_DIR, f"scan_{job_id}.{fmt}")
 
     if fmt == "json":
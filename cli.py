@@ -70,6 +70,8 @@ def main():
                         help="Number of concurrent threads (default: 200)")
     parser.add_argument("--timeout", type=float, default=1.0,
                         help="Connection timeout in seconds (default: 1.0)")
+    parser.add_argument("--syn", action="store_true",
+                        help="Half-open SYN scan (requires root on Linux; falls back to connect scan)")
     parser.add_argument("--export", choices=["json", "csv", "both"],
                         help="Export results to file (json/csv/both)")
     parser.add_argument("--output", default="scan_results",
@@ -80,6 +82,7 @@ def main():
     args = parser.parse_args()
     port_range = parse_range(args.port_range)
     found_open = []
+    last_drawn = 0
 
     print(f"{BOLD}Target  :{RESET} {args.host}")
     print(f"{BOLD}Range   :{RESET} {args.port_range}")
@@ -89,13 +92,18 @@ def main():
     print(f"{YELLOW}[*] Starting scan...{RESET}\n")
 
     def on_progress(scanned, total, result):
-        if result["state"] == "open":
+        nonlocal last_drawn
+        is_open = result["state"] == "open"
+        if is_open:
             found_open.append(result)
             svc = result["service"]
             port = result["port"]
             print(f"\r{GREEN}[OPEN]{RESET} Port {BOLD}{port:>5}{RESET}  →  {CYAN}{svc}{RESET}")
-        sys.stdout.write(progress_bar(scanned, total))
-        sys.stdout.flush()
+        # Redraw the bar only every 64 ports (or after an open-port line)
+        if is_open or scanned == total or scanned - last_drawn >= 64:
+            last_drawn = scanned
+            sys.stdout.write(progress_bar(scanned, total))
+            sys.stdout.flush()
 
     results = run_scan(
         host=args.host,
@@ -103,6 +111,7 @@ def main():
         max_threads=args.threads,
         timeout=args.timeout,
         progress_callback=on_progress,
+        syn=args.syn,
     )
 
     if "error" in results:
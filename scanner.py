@@ -2,15 +2,35 @@
 NetPort Scanner - Core scanning engine
 """
 
+import asyncio
+import ctypes
+import errno
+import random
+import select
 import socket
+import struct
+import sys
 import threading
-import json
 import csv
+import ipaddress
 import os
+import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Optional
 
+import orjson
+
+try:
+    import uvloop  # optional: faster libuv-based event loop
+except ImportError:
+    uvloop = None
+
+try:
+    import aiodns  # optional: async c-ares resolver
+except ImportError:
+    aiodns = None
+
 # Common services mapped to ports
 SERVICE_MAP = {
     21: "FTP", 22: "SSH", 23: "Telnet", 25: "SMTP", 53: "DNS",
@@ -42,25 +62,63 @@ SECURITY_TIPS = {
     "Elasticsearch": "🚨 Elasticsearch has no auth by default. Restrict immediately.",
 }
 
+DEFAULT_TIP = "ℹ️  Review whether this port needs to be publicly accessible."
 
-def scan_port(host: str, port: int, timeout: float = 1.0) -> dict:
-    """Attempt a TCP connection to determine if a port is open."""
-    result = {
+# Bound lookups for the per-port hot path
+_SERVICE_GET = SERVICE_MAP.get
+_TIP_GET = SECURITY_TIPS.get
+
+# How to grab a banner per service:
+#   "recv" - server speaks first, just read its greeting
+#   "head" - send an HTTP HEAD probe, then read
+#   "skip" - TLS / binary protocols that won't answer a text probe
+# Services not listed default to "head".
+BANNER_STRATEGY = {
+    "FTP": "recv", "SSH": "recv", "Telnet": "recv", "SMTP": "recv",
+    "SMTP-TLS": "recv", "POP3": "recv", "IMAP": "recv", "MySQL": "recv",
+    "VNC": "recv",
+    "HTTP": "head", "HTTP-Alt": "head", "HTTP-Alt2": "head", "Elasticsearch": "head",
+    "HTTPS": "skip", "HTTPS-Alt": "skip", "SMTPS": "skip", "IMAPS": "skip",
+    "POP3S": "skip", "Kubernetes API": "skip", "DNS": "skip", "RPC": "skip",
+    "MSRPC": "skip", "NetBIOS": "skip", "SMB": "skip", "MSSQL": "skip",
+    "Oracle DB": "skip", "PPTP VPN": "skip", "NFS": "skip", "RDP": "skip",
+    "PostgreSQL": "skip", "Redis": "skip", "MongoDB": "skip",
+}
+
+HEAD_PROBE = b"HEAD / HTTP/1.0\r\n\r\n"
+
+# SO_LINGER {on, 0s}: close() sends RST, so probes leave no TIME_WAIT entries
+LINGER_RST = struct.pack("ii", 1, 0)
+
+
+def _closed_result(port: int) -> dict:
+    """Fresh per-port result dict, initially closed with no banner."""
+    return {
         "port": port,
         "state": "closed",
-        "service": SERVICE_MAP.get(port, "Unknown"),
+        "service": _SERVICE_GET(port, "Unknown"),
         "banner": None,
     }
+
+
+def scan_port(host: str, port: int, timeout: float = 1.0) -> dict:
+    """Attempt a TCP connection to determine if a port is open."""
+    result = _closed_result(port)
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
             sock.settimeout(timeout)
             conn = sock.connect_ex((host, port))
             if conn == 0:
                 result["state"] = "open"
+                strategy = BANNER_STRATEGY.get(result["service"], "head")
+                if strategy == "skip":
+                    return result
                 # Try banner grabbing
                 try:
                     sock.settimeout(0.5)
-                    sock.send(b"HEAD / HTTP/1.0\r\n\r\n")
+                    if strategy == "head":
+                        sock.send(HEAD_PROBE)
                     banner = sock.recv(1024).decode(errors="ignore").strip()
                     result["banner"] = banner[:200] if banner else None
                 except Exception:
@@ -70,13 +128,481 @@ def scan_port(host: str, port: int, timeout: float = 1.0) -> dict:
     return result
 
 
+async def _grab_banner_async(reader, writer, result: dict) -> dict:
+    """Grab a banner over an open connection per BANNER_STRATEGY, then close it."""
+    strategy = BANNER_STRATEGY.get(result["service"], "head")
+    try:
+        # Try banner grabbing
+        try:
+            if strategy == "skip":
+                return result
+            if strategy == "head":
+                writer.write(HEAD_PROBE)
+                await writer.drain()
+            data = await asyncio.wait_for(reader.read(1024), 0.5)
+            banner = data.decode(errors="ignore").strip()
+            result["banner"] = banner[:200] if banner else None
+        except Exception:
+            pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+    return result
+
+
+async def _scan_port_async(host: str, port: int, timeout: float, sem: asyncio.Semaphore) -> dict:
+    """
+    Non-blocking equivalent of `scan_port`, bounded by `sem`.
+    Only used on platforms without select.poll (see `_iter_scan`).
+    """
+    result = _closed_result(port)
+    async with sem:
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (asyncio.TimeoutError, OSError):
+            return result
+        result["state"] = "open"
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+        return await _grab_banner_async(reader, writer, result)
+
+
+def batch_connect(ip: str, ports, timeout: float = 1.0) -> tuple:
+    """
+    Issue non-blocking connect()s to every port in `ports` and wait on them
+    with a single poll() loop. Returns `(connected, unprobed)`: a
+    {port: connected socket} dict for open ports, which the caller owns (and
+    must close), and the list of ports that were never tried because the
+    process ran out of file descriptors.
+    """
+    poller = select.poll()
+    pending = {}
+    connected = {}
+    todo = list(ports)
+    try:
+        while todo:
+            started = 0
+            for port in todo:
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                except OSError as e:
+                    if e.errno in (errno.EMFILE, errno.ENFILE):
+                        break
+                    started += 1
+                    continue
+                started += 1
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+                    sock.setblocking(False)
+                    err = sock.connect_ex((ip, port))
+                except OSError:
+                    sock.close()
+                    continue
+                if err == 0:
+                    connected[port] = sock
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    pending[sock.fileno()] = (port, sock)
+                    poller.register(sock, select.POLLOUT)
+                else:
+                    sock.close()
+            if not started:
+                break  # out of descriptors even after draining: hand the rest back
+            todo = todo[started:]
+
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in poller.poll(remaining * 1000):
+                    port, sock = pending.pop(fd)
+                    poller.unregister(fd)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        connected[port] = sock
+                    else:
+                        sock.close()
+            for fd, (_, sock) in pending.items():
+                poller.unregister(fd)
+                sock.close()
+            pending.clear()
+    except BaseException:
+        for _, sock in pending.values():
+            sock.close()
+        for sock in connected.values():
+            sock.close()
+        raise
+    return connected, todo
+
+
+# Linux SO_ATTACH_FILTER; not exported by the socket module
+SO_ATTACH_FILTER = getattr(socket, "SO_ATTACH_FILTER", 26)
+
+TCP_SYN = 0x02
+TCP_ACK = 0x10
+
+# SYN sweep pacing: yield to the event loop (so SYN-ACKs are drained)
+# after every SYN_BATCH packets, sleeping SYN_BATCH_DELAY seconds
+SYN_BATCH = 64
+SYN_BATCH_DELAY = 0.001
+SYN_SEND_RETRIES = 50
+SYN_RCVBUF = 16 * 1024 * 1024
+SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+
+
+def _local_ip_for(ip: str) -> str:
+    """Return the local address the kernel would route traffic to `ip` from."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect((ip, 9))
+        return s.getsockname()[0]
+
+
+def _syn_scan_supported() -> bool:
+    """
+    True on Linux when this process may open raw sockets (root / CAP_NET_RAW).
+    BSD/macOS kernels never deliver TCP segments to raw sockets, so SYN-ACKs
+    would go unseen there.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP).close()
+        return True
+    except OSError:
+        return False
+
+
+def _words_sum(data: bytes) -> int:
+    return sum(struct.unpack(f"!{len(data) // 2}H", data))
+
+
+def _attach_synack_filter(sock: socket.socket, ip: str):
+    """
+    Attach a classic BPF program so `sock` only wakes up for SYN-ACKs from `ip`.
+    Best effort: if the kernel rejects the program, `_syn_probe` still
+    filters every packet in Python.
+    """
+    target = struct.unpack("!I", socket.inet_aton(ip))[0]
+    insns = [
+        (0x20, 0, 0, 12),                        # ld  [12]          ; IP src
+        (0x15, 0, 4, target),                    # jeq #target, ?, drop
+        (0xB1, 0, 0, 0),                         # ldx 4*([0]&0xf)   ; IP header len
+        (0x50, 0, 0, 13),                        # ldb [x+13]        ; TCP flags
+        (0x54, 0, 0, TCP_SYN | TCP_ACK),         # and #SYN|ACK
+        (0x15, 1, 0, TCP_SYN | TCP_ACK),         # jeq #SYN|ACK, accept, drop
+        (0x06, 0, 0, 0),                         # drop: ret #0
+        (0x06, 0, 0, 0xFFFF),                    # accept: ret #65535
+    ]
+    prog = b"".join(struct.pack("HBBI", *i) for i in insns)
+    buf = ctypes.create_string_buffer(prog, len(prog))
+    fprog = struct.pack("HL", len(insns), ctypes.addressof(buf))
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+    except OSError:
+        pass
+
+
+async def _syn_probe(ip: str, src_ip: str, ports: list, timeout: float) -> set:
+    """
+    Half-open SYN scan: send one SYN per port from a single raw socket and
+    collect SYN-ACKs for `timeout` seconds. Returns the set of open ports.
+    Requires raw socket privileges on Linux.
+    """
+    sport = random.randint(32768, 60999)
+    seq = random.getrandbits(32)
+
+    # Pseudo-header + TCP header with dport and checksum zeroed; only dport
+    # varies per packet, so its contribution is added to this base sum.
+    pseudo = socket.inet_aton(src_ip) + socket.inet_aton(ip) + struct.pack("!BBH", 0, socket.IPPROTO_TCP, 20)
+    template = struct.pack("!HHIIBBHHH", sport, 0, seq, 0, 5 << 4, TCP_SYN, 1024, 0, 0)
+    base_sum = _words_sum(pseudo + template)
+    head, tail = template[:2], template[4:16]
+
+    open_ports = set()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+    _attach_synack_filter(receiver, ip)
+    # Room for a burst of SYN-ACKs; FORCE bypasses rmem_max (we are root)
+    try:
+        receiver.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, SYN_RCVBUF)
+    except OSError:
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SYN_RCVBUF)
+    receiver.setblocking(False)
+
+    def _on_readable():
+        while True:
+            try:
+                pkt, addr = receiver.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            ihl = (pkt[0] & 0x0F) * 4
+            if addr[0] != ip or len(pkt) < ihl + 14:
+                continue
+            src_port, dst_port = struct.unpack_from("!HH", pkt, ihl)
+            flags = pkt[ihl + 13]
+            if dst_port == sport and flags & (TCP_SYN | TCP_ACK) == TCP_SYN | TCP_ACK:
+                open_ports.add(src_port)
+
+    loop = asyncio.get_running_loop()
+    loop.add_reader(receiver.fileno(), _on_readable)
+    try:
+        for i, port in enumerate(ports, 1):
+            csum = base_sum + port
+            csum = (csum & 0xFFFF) + (csum >> 16)
+            csum = (csum & 0xFFFF) + (csum >> 16)
+            packet = head + struct.pack("!H", port) + tail + struct.pack("!HH", ~csum & 0xFFFF, 0)
+            for _ in range(SYN_SEND_RETRIES):
+                try:
+                    sender.sendto(packet, (ip, 0))
+                    break
+                except OSError as e:
+                    if e.errno not in (errno.ENOBUFS, errno.EAGAIN):
+                        break
+                    # Transmit queue full: let it drain instead of losing the probe
+                    await asyncio.sleep(SYN_BATCH_DELAY)
+            if i % SYN_BATCH == 0:
+                await asyncio.sleep(SYN_BATCH_DELAY)
+        await asyncio.sleep(timeout)
+    finally:
+        loop.remove_reader(receiver.fileno())
+        sender.close()
+        receiver.close()
+    return open_ports
+
+
+async def _iter_connect_scan(ip: str, ports: list, timeout: float, concurrency: int):
+    """
+    Yield `_scan_port_async` results in completion order. Fallback engine
+    for platforms without select.poll (Windows); elsewhere `_iter_poll_scan`
+    is used.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    tasks = [asyncio.create_task(_scan_port_async(ip, p, timeout, sem)) for p in ports]
+    for coro in asyncio.as_completed(tasks):
+        yield await coro
+
+
+# How long _iter_poll_scan waits for descriptors held outside the scan
+# (other scans, the app) before giving up with EMFILE
+FD_RETRY_DELAY = 0.05
+FD_RETRY_LIMIT = 100
+
+
+async def _iter_poll_scan(ip: str, ports: list, timeout: float, concurrency: int):
+    """
+    Yield results for `ports` in completion order. Ports are classified in
+    chunks by `batch_connect` off the event loop; open sockets are handed
+    to asyncio for banner grabbing, and those grabs stay in flight while
+    the next chunk connects. Banner sockets plus the connecting chunk never
+    exceed `concurrency` descriptors.
+    """
+    loop = asyncio.get_running_loop()
+    results = asyncio.Queue()
+    banners = set()
+    slot_freed = asyncio.Event()
+
+    def _banner_done(task):
+        banners.discard(task)
+        slot_freed.set()
+        if not task.cancelled():
+            results.put_nowait(task.result())
+
+    async def _wait_for_banners(limit: int):
+        """Block until at most `limit` banner grabs are in flight."""
+        while len(banners) > limit:
+            slot_freed.clear()
+            await slot_freed.wait()
+
+    async def _produce():
+        try:
+            todo = list(ports)
+            starved = 0
+            while todo:
+                await _wait_for_banners(concurrency - 1)
+                size = concurrency - len(banners)
+                chunk, todo = todo[:size], todo[size:]
+                connected, unprobed = await loop.run_in_executor(
+                    None, batch_connect, ip, chunk, timeout
+                )
+                for port in chunk[:len(chunk) - len(unprobed)]:
+                    result = _closed_result(port)
+                    sock = connected.get(port)
+                    if sock is None:
+                        results.put_nowait(result)
+                        continue
+                    result["state"] = "open"
+                    try:
+                        reader, writer = await asyncio.open_connection(sock=sock)
+                    except OSError:
+                        sock.close()
+                        results.put_nowait(result)
+                        continue
+                    task = asyncio.create_task(_grab_banner_async(reader, writer, result))
+                    banners.add(task)
+                    task.add_done_callback(_banner_done)
+                if not unprobed:
+                    starved = 0
+                    continue
+                # Out of descriptors: never report these as closed. Let our
+                # banner grabs release theirs, then retry.
+                todo = unprobed + todo
+                if len(unprobed) == len(chunk) and not banners:
+                    starved += 1
+                    if starved > FD_RETRY_LIMIT:
+                        raise OSError(errno.EMFILE, "No file descriptors available for scanning")
+                    await asyncio.sleep(FD_RETRY_DELAY)
+                await _wait_for_banners(0)
+        except Exception as exc:
+            results.put_nowait(exc)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        for _ in range(len(ports)):
+            item = await results.get()
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        for task in list(banners):
+            task.cancel()
+
+
+async def _iter_syn_scan(ip: str, src_ip: str, ports: list, timeout: float):
+    """Yield one result per port from a single SYN sweep."""
+    open_ports = await _syn_probe(ip, src_ip, ports, timeout)
+    for port in ports:
+        result = _closed_result(port)
+        if port in open_ports:
+            result["state"] = "open"
+        yield result
+
+
+def _iter_scan(ip: str, ports: list, timeout: float, concurrency: int, syn: bool = False):
+    """
+    Pick the SYN scan when requested and permitted, else the poll()-batched
+    connect scan, or the per-port asyncio scan where poll() is unavailable.
+    """
+    if syn and _syn_scan_supported():
+        try:
+            src_ip = _local_ip_for(ip)
+        except OSError:
+            src_ip = None  # no route to target; let the connect scan report it
+        if src_ip:
+            return _iter_syn_scan(ip, src_ip, ports, timeout)
+    if hasattr(select, "poll"):
+        return _iter_poll_scan(ip, ports, timeout, concurrency)
+    return _iter_connect_scan(ip, ports, timeout, concurrency)
+
+
+def syn_scan(host: str, ports, timeout: float = 1.0) -> list:
+    """
+    Half-open SYN scan of `ports` on `host`.
+    Falls back to a connect scan when raw sockets are unavailable (not
+    root, or not Linux) or there is no route to `host`.
+    """
+    resolved_ip = resolve_host(host)
+    if not resolved_ip:
+        return []
+    ports = list(ports)
+
+    async def _collect():
+        return [r async for r in _iter_scan(resolved_ip, ports, timeout, 200, syn=True)]
+
+    return _run_async(_collect())
+
+
+# LRU resolver cache (insertion-ordered): { hostname: (ip, expires_at) }
+DNS_CACHE_TTL = 300
+DNS_CACHE_MAX = 1024
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()  # each web job runs its own loop in its own thread
+
+
+def _run_async(coro):
+    """Run `coro` to completion on uvloop when installed, else the default loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _cached_ip(host: str) -> Optional[str]:
+    """Return `host` itself if it is an IPv4 literal, else a fresh cache hit or None."""
+    try:
+        return str(ipaddress.IPv4Address(host))
+    except ValueError:
+        pass
+
+    with _dns_cache_lock:
+        cached = _dns_cache.pop(host, None)
+        if cached and cached[1] > time.monotonic():
+            _dns_cache[host] = cached  # re-insert as most recently used
+            return cached[0]
+    return None
+
+
+def _cache_ip(host: str, ip: str):
+    with _dns_cache_lock:
+        _dns_cache.pop(host, None)
+        if len(_dns_cache) >= DNS_CACHE_MAX:
+            _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[host] = (ip, time.monotonic() + DNS_CACHE_TTL)
+
+
 def resolve_host(host: str) -> Optional[str]:
-    """Resolve hostname to IP. Returns None on failure."""
+    """Resolve hostname to IP (cached for DNS_CACHE_TTL seconds). Returns None on failure."""
+    ip = _cached_ip(host)
+    if ip:
+        return ip
+
     try:
-        return socket.gethostbyname(host)
+        ip = socket.gethostbyname(host)
     except socket.gaierror:
         return None
 
+    _cache_ip(host, ip)
+    return ip
+
+
+_RESOLVE_ERRORS = (socket.gaierror, IndexError) + ((aiodns.error.DNSError,) if aiodns else ())
+
+
+async def resolve_host_async(host: str) -> Optional[str]:
+    """
+    Non-blocking `resolve_host`, sharing its cache. Uses aiodns when
+    installed, else the event loop's getaddrinfo (run in a worker thread).
+    """
+    ip = _cached_ip(host)
+    if ip:
+        return ip
+
+    try:
+        if aiodns is not None:
+            resolver = aiodns.DNSResolver()
+            try:
+                answer = await resolver.getaddrinfo(host, family=socket.AF_INET)
+            finally:
+                if hasattr(resolver, "close"):  # aiodns >= 3.5
+                    await resolver.close()
+            ip = answer.nodes[0].addr[0].decode()
+        else:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, None, family=socket.AF_INET)
+            ip = infos[0][4][0]
+    except _RESOLVE_ERRORS:
+        return None
+
+    _cache_ip(host, ip)
+    return ip
+
+
+# Progress callbacks are coalesced: fired for every open port, otherwise
+# once per PROGRESS_BATCH ports or PROGRESS_INTERVAL seconds.
+PROGRESS_BATCH = 100
+PROGRESS_INTERVAL = 0.05
+
 
 def run_scan(
     host: str,
@@ -84,46 +610,50 @@ def run_scan(
     max_threads: int = 200,
     timeout: float = 1.0,
     progress_callback=None,
+    syn: bool = False,
 ) -> dict:
     """
     Run a full port scan against `host`.
+    With `syn=True` a half-open SYN scan is used if running as root on Linux.
 
     Returns a result dictionary with metadata and open ports.
     """
     start_time = datetime.now()
 
-    resolved_ip = resolve_host(host)
-    if not resolved_ip:
-        return {"error": f"Could not resolve host: {host}"}
-
     start_port, end_port = port_range
     total_ports = end_port - start_port + 1
     open_ports = []
-    scanned = 0
-    lock = threading.Lock()
 
-    def _scan(port):
-        nonlocal scanned
-        res = scan_port(resolved_ip, port, timeout)
-        with lock:
+    async def _run():
+        resolved_ip = await resolve_host_async(host)
+        if not resolved_ip:
+            return None
+
+        # Single-threaded event loop: no lock needed around `scanned`
+        ports = range(start_port, end_port + 1)
+        scanned = 0
+        last_reported = time.monotonic()
+        async for result in _iter_scan(resolved_ip, ports, timeout, max_threads, syn):
             scanned += 1
-            if progress_callback:
-                progress_callback(scanned, total_ports, res)
-        return res
-
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        futures = {executor.submit(_scan, p): p for p in range(start_port, end_port + 1)}
-        for future in as_completed(futures):
-            result = future.result()
-            if result["state"] == "open":
+            is_open = result["state"] == "open"
+            if is_open:
+                result["recommendation"] = _TIP_GET(result["service"], DEFAULT_TIP)
                 open_ports.append(result)
+            if progress_callback and (
+                is_open
+                or scanned % PROGRESS_BATCH == 0
+                or scanned == total_ports
+                or time.monotonic() - last_reported >= PROGRESS_INTERVAL
+            ):
+                last_reported = time.monotonic()
+                progress_callback(scanned, total_ports, result)
+        return resolved_ip
 
-    open_ports.sort(key=lambda x: x["port"])
+    resolved_ip = _run_async(_run())
+    if not resolved_ip:
+        return {"error": f"Could not resolve host: {host}"}
 
-    # Attach security recommendations
-    for entry in open_ports:
-        svc = entry["service"]
-        entry["recommendation"] = SECURITY_TIPS.get(svc, "ℹ️  Review whether this port needs to be publicly accessible.")
+    open_ports.sort(key=itemgetter("port"))
 
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -143,15 +673,18 @@ def run_scan(
 
 def export_json(results: dict, filepath: str):
     """Export scan results to a JSON file."""
-    with open(filepath, "w") as f:
-        json.dump(results, f, indent=2)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
 
 def export_csv(results: dict, filepath: str):
     """Export open ports to a CSV file."""
     fieldnames = ["port", "service", "state", "banner", "recommendation"]
     with open(filepath, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for port_info in results.get("open_ports", []):
-            writer.writerow({k: port_info.get(k, "") for k in fieldnames})
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (p.get("port", ""), p.get("service", ""), p.get("state", ""),
+             p.get("banner", "") or "", p.get("recommendation", ""))
+            for p in results.get("open_ports", [])
+        )